@@ -1,6 +1,8 @@
 import json
 import sys
+import threading
 import tkinter as tk
+from collections import OrderedDict
 from pathlib import Path
 from tkinter import messagebox, scrolledtext, ttk
 
@@ -12,6 +14,9 @@ if str(PYTHON_SIDECAR_ROOT) not in sys.path:
 
 from romaji_service.pipeline import PronunciationRomajiPipeline  # noqa: E402
 
+SPINNER_INTERVAL_MS = 100
+RESULT_CACHE_SIZE = 128
+
 
 class RomajiGUITool:
     def __init__(self, root):
@@ -19,9 +24,35 @@ class RomajiGUITool:
         self.root.title("Pronunciation Romaji Tool")
         self.root.geometry("980x760")
 
-        self.pipeline = PronunciationRomajiPipeline()
+        self.pipeline = None
+        self._busy = False
+        self._spinner_job = None
+        self._result_cache = OrderedDict()
         self.setup_ui()
+
+        # Loading KWJA/Sudachi dictionaries takes seconds; show the window while it happens.
+        self.romanize_btn.config(state=tk.DISABLED)
+        self.status_var.set("Loading engine...")
+        threading.Thread(target=self._load_pipeline_worker, daemon=True).start()
+
+    def _load_pipeline_worker(self):
+        try:
+            pipeline = PronunciationRomajiPipeline()
+        except Exception as exc:
+            self.root.after(0, self._pipeline_error, exc)
+            return
+        self.root.after(0, self._pipeline_ready, pipeline)
+
+    def _pipeline_ready(self, pipeline):
+        self.pipeline = pipeline
         self.refresh_engine_status()
+        self.romanize_btn.config(state=tk.NORMAL)
+        self.status_var.set("Ready")
+
+    def _pipeline_error(self, exc):
+        self.engine_var.set("Engine: unavailable")
+        self.status_var.set("Error occurred")
+        messagebox.showerror("Error", f"Failed to load romanization engine: {exc}")
 
     def setup_ui(self):
         main_frame = ttk.Frame(self.root, padding="10")
@@ -55,9 +86,8 @@ class RomajiGUITool:
         self.romanize_btn = ttk.Button(button_frame, text="Romanize", command=self.romanize, width=18)
         self.romanize_btn.grid(row=0, column=0, padx=(0, 8))
 
-        ttk.Button(button_frame, text="Clear", command=self.clear_all, width=18).grid(
-            row=0, column=1, padx=(0, 8)
-        )
+        self.clear_btn = ttk.Button(button_frame, text="Clear", command=self.clear_all, width=18)
+        self.clear_btn.grid(row=0, column=1, padx=(0, 8))
         ttk.Button(button_frame, text="Refresh engine info", command=self.refresh_engine_status, width=18).grid(
             row=0, column=2
         )
@@ -85,6 +115,9 @@ class RomajiGUITool:
         status_bar.grid(row=9, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
 
     def refresh_engine_status(self):
+        if self.pipeline is None:
+            return
+        self.pipeline.refresh_jumanpp()
         health = self.pipeline.health()
         components = health["components"]
         mode = health["mode"]
@@ -103,37 +136,74 @@ class RomajiGUITool:
             messagebox.showwarning("Warning", "Please enter Japanese text to romanize")
             return
 
-        self.status_var.set("Romanizing...")
+        cached = self._result_cache.get(japanese_text)
+        if cached is not None:
+            self._result_cache.move_to_end(japanese_text)
+            self._romanize_done(japanese_text, cached)
+            return
+
         self.romanize_btn.config(state=tk.DISABLED)
-        self.root.update_idletasks()
+        self.clear_btn.config(state=tk.DISABLED)
+        self._busy = True
+        self._tick_spinner(0)
+
+        threading.Thread(target=self._romanize_worker, args=(japanese_text,), daemon=True).start()
 
+    def _romanize_worker(self, japanese_text):
         try:
             result = self.pipeline.romanize_text(japanese_text, {"source": "gui"})
-            self.output_text.delete("1.0", tk.END)
-            self.output_text.insert("1.0", result["text"])
-
-            details = {
-                "confidence": result["confidence"],
-                "warnings": result["warnings"],
-                "engine": result["engine"],
-                "stages": result["stages"],
-            }
-            self.details_text.delete("1.0", tk.END)
-            self.details_text.insert("1.0", json.dumps(details, indent=2, ensure_ascii=False))
-
-            self.status_var.set(
-                f"Romanization complete (confidence={result['confidence']:.2f}, warnings={len(result['warnings'])})"
-            )
         except Exception as exc:
-            messagebox.showerror("Error", f"Romanization failed: {exc}")
-            self.status_var.set("Error occurred")
-        finally:
-            self.romanize_btn.config(state=tk.NORMAL)
+            self.root.after(0, self._romanize_error, exc)
+            return
+        self.root.after(0, self._romanize_done, japanese_text, result)
+
+    def _tick_spinner(self, step):
+        if not self._busy:
+            return
+        self.status_var.set("Romanizing" + "." * (step % 3 + 1))
+        self._spinner_job = self.root.after(SPINNER_INTERVAL_MS, self._tick_spinner, step + 1)
+
+    def _finish_busy(self):
+        self._busy = False
+        if self._spinner_job is not None:
+            self.root.after_cancel(self._spinner_job)
+            self._spinner_job = None
+        self.romanize_btn.config(state=tk.NORMAL)
+        self.clear_btn.config(state=tk.NORMAL)
+
+    def _romanize_done(self, japanese_text, result):
+        self._finish_busy()
+        self._result_cache[japanese_text] = result
+        self._result_cache.move_to_end(japanese_text)
+        while len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
 
-    def clear_all(self):
-        self.input_text.delete("1.0", tk.END)
         self.output_text.delete("1.0", tk.END)
+        self.output_text.insert("1.0", result["text"])
+
+        details = {
+            "confidence": result["confidence"],
+            "warnings": result["warnings"],
+            "engine": result["engine"],
+            "stages": result["stages"],
+        }
         self.details_text.delete("1.0", tk.END)
+        self.details_text.insert("1.0", json.dumps(details, indent=2, ensure_ascii=False))
+
+        self.status_var.set(
+            f"Romanization complete (confidence={result['confidence']:.2f}, warnings={len(result['warnings'])})"
+        )
+
+    def _romanize_error(self, exc):
+        self._finish_busy()
+        self.status_var.set("Error occurred")
+        messagebox.showerror("Error", f"Romanization failed: {exc}")
+
+    def clear_all(self):
+        # One Tcl round-trip instead of a separate delete call per widget. ScrolledText.__str__ is the
+        # wrapping frame's path, so address the text widget itself via _w.
+        widgets = (self.input_text, self.output_text, self.details_text)
+        self.root.tk.eval("; ".join(f"{widget._w} delete 1.0 end" for widget in widgets))
         self.status_var.set("Cleared")
 
 
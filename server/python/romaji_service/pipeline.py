@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import shutil
@@ -35,6 +36,8 @@ ASCII_PUNCTUATION = {
     "〜": "~",
 }
 
+ASCII_PUNCTUATION_TABLE = str.maketrans(ASCII_PUNCTUATION)
+
 BASE_ROMAJI = {
     "あ": "a",
     "い": "i",
@@ -241,19 +244,19 @@ def last_vowel(value: str) -> str:
     return ""
 
 
-def next_syllable_romaji(text: str, index: int) -> str:
-    if index >= len(text):
-        return ""
-    hira = katakana_to_hiragana(text[index:])
-    if not hira:
+def next_syllable_romaji(hira: str, index: int) -> str:
+    # Callers pass hiragana; skip any run of sokuon, then only a two-kana combo can matter.
+    while index < len(hira) and hira[index] == "っ":
+        index += 1
+    pair = hira[index : index + 2]
+    if not pair:
         return ""
-    if hira[0] == "っ":
-        return next_syllable_romaji(hira, 1)
-    if len(hira) >= 2 and hira[:2] in COMBO_ROMAJI:
-        return COMBO_ROMAJI[hira[:2]]
-    return BASE_ROMAJI.get(hira[0], "")
+    if pair in COMBO_ROMAJI:
+        return COMBO_ROMAJI[pair]
+    return BASE_ROMAJI.get(pair[0], "")
 
 
+@functools.lru_cache(maxsize=4096)
 def kana_to_ascii_hepburn(text: str) -> str:
     hira = katakana_to_hiragana(text.replace(" ", ""))
     output: list[str] = []
@@ -314,6 +317,7 @@ class PronunciationRomajiPipeline:
         self.text_overrides = dict(self.overrides.get("text_overrides", {}))
         self.romaji_overrides = dict(self.overrides.get("romaji_overrides", {}))
         self._token_keys = sorted(self.token_overrides.keys(), key=len, reverse=True)
+        self._protected_keys = sorted({*self._token_keys, *self.romaji_overrides.keys()}, key=len, reverse=True)
 
         self._kwja_error: str | None = None
         self._sudachi_error: str | None = None
@@ -322,6 +326,8 @@ class PronunciationRomajiPipeline:
         self._kwja = self._load_kwja()
         self._sudachi_tokenizer, self._sudachi_split_mode = self._load_sudachi()
         self._pyopenjtalk = self._load_pyopenjtalk()
+        self._jumanpp_path: str | None = None
+        self.refresh_jumanpp()
 
     def _default_overrides_path(self) -> Path:
         return Path(__file__).resolve().parents[2] / "config" / "romaji-overrides.json"
@@ -363,11 +369,13 @@ class PronunciationRomajiPipeline:
             self._pyopenjtalk_error = str(exc)
             return None
 
+    def refresh_jumanpp(self) -> None:
+        self._jumanpp_path = os.environ.get("JUMANPP_BIN") or shutil.which("jumanpp")
+
     def _jumanpp_health(self) -> dict[str, Any]:
-        candidate = os.environ.get("JUMANPP_BIN") or shutil.which("jumanpp")
         return {
-            "available": bool(candidate),
-            "path": candidate,
+            "available": bool(self._jumanpp_path),
+            "path": self._jumanpp_path,
         }
 
     def health(self) -> dict[str, Any]:
@@ -396,12 +404,19 @@ class PronunciationRomajiPipeline:
 
     def normalize_text(self, text: str) -> str:
         normalized = unicodedata.normalize("NFKC", text)
-        normalized = normalized.replace("\r\n", "\n").replace("\r", "\n")
-        return normalized.translate(str.maketrans(ASCII_PUNCTUATION))
+        if "\r" in normalized:
+            normalized = normalized.replace("\r\n", "\n").replace("\r", "\n")
+        return normalized.translate(ASCII_PUNCTUATION_TABLE)
 
     def inspect_text(self, text: str) -> dict[str, Any]:
-        japanese_count = sum(1 for char in text if is_japanese_char(char))
-        ascii_count = sum(1 for char in text if ord(char) < 128 and not char.isspace())
+        japanese_count = 0
+        ascii_count = 0
+        for char in text:
+            if ord(char) < 128:
+                if not char.isspace():
+                    ascii_count += 1
+            elif is_japanese_char(char):
+                japanese_count += 1
         line_count = text.count("\n") + 1 if text else 0
         return {
             "has_japanese": japanese_count > 0,
@@ -433,13 +448,27 @@ class PronunciationRomajiPipeline:
         return {"status": "available", "reason": "No supported adapter method was found"}
 
     def romanize_text(self, text: str, context: dict[str, Any] | None = None) -> dict[str, Any]:
-        context = context or {}
+        return self._romanize_text(text, context or {}, self.health())
+
+    def _romanize_text(
+        self,
+        text: str,
+        context: dict[str, Any],
+        engine: dict[str, Any],
+        analysis: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         normalized = self.normalize_text(text)
         inspection = self.inspect_text(normalized)
+        if not inspection["has_japanese"]:
+            analysis = {"status": "skipped"}
+        elif analysis is None:
+            analysis = self.contextual_analysis(normalized)
+        else:
+            analysis = {**analysis, "scope": "document"}
         stages: dict[str, Any] = {
             "normalization": {"input": text, "normalized": normalized},
             "inspection": inspection,
-            "contextual_analysis": self.contextual_analysis(normalized) if inspection["has_japanese"] else {"status": "skipped"},
+            "contextual_analysis": analysis,
         }
 
         if normalized in self.text_overrides:
@@ -455,7 +484,7 @@ class PronunciationRomajiPipeline:
                 "text": result_text,
                 "confidence": 1.0,
                 "warnings": [],
-                "engine": self.health(),
+                "engine": engine,
                 "context": context,
                 "stages": stages,
                 "tokens": [
@@ -480,7 +509,7 @@ class PronunciationRomajiPipeline:
                 "text": normalized,
                 "confidence": 1.0,
                 "warnings": [],
-                "engine": self.health(),
+                "engine": engine,
                 "context": context,
                 "stages": stages,
                 "tokens": [],
@@ -506,7 +535,7 @@ class PronunciationRomajiPipeline:
         }
         stages["fallback_routing"] = {
             "used": tokenization_mode == "fallback" or any(token["source"] == "unknown-kanji" for token in rendered_tokens),
-            "jumanpp_available": self._jumanpp_health()["available"],
+            "jumanpp_available": engine["components"]["jumanpp"]["available"],
         }
         stages["pronunciation_resolution"] = {
             "pyopenjtalk": self._pyopenjtalk is not None,
@@ -519,7 +548,7 @@ class PronunciationRomajiPipeline:
             "text": result_text,
             "confidence": confidence,
             "warnings": warnings,
-            "engine": self.health(),
+            "engine": engine,
             "context": context,
             "stages": stages,
             "tokens": rendered_tokens,
@@ -527,12 +556,22 @@ class PronunciationRomajiPipeline:
 
     def romanize_batch(self, texts: list[str], context: dict[str, Any] | None = None) -> dict[str, Any]:
         context = context or {}
-        items = [self.romanize_text(text, context) for text in texts]
+        engine = self.health()
+        # KWJA is the costliest stage, so run it once over the whole document rather than per line.
+        document = self.normalize_text("\n".join(texts))
+        analysis = self.contextual_analysis(document) if self.inspect_text(document)["has_japanese"] else None
+        # Lyrics repeat whole lines (choruses), so each distinct line is only romanized once.
+        unique: dict[str, dict[str, Any]] = {}
+        for text in texts:
+            if text not in unique:
+                unique[text] = self._romanize_text(text, context, engine, analysis)
+        items = [unique[text] for text in texts]
         warnings = [warning for item in items for warning in item["warnings"]]
         return {
             "items": items,
             "warnings": warnings,
-            "engine": self.health(),
+            "engine": engine,
+            "contextual_analysis": analysis if analysis is not None else {"status": "skipped"},
         }
 
     def tokenize(self, text: str) -> tuple[list[Token], str]:
@@ -562,7 +601,7 @@ class PronunciationRomajiPipeline:
     def _fallback_tokenize(self, text: str) -> list[Token]:
         tokens: list[Token] = []
         index = 0
-        protected_keys = sorted({*self._token_keys, *self.romaji_overrides.keys()}, key=len, reverse=True)
+        protected_keys = self._protected_keys
 
         while index < len(text):
             char = text[index]
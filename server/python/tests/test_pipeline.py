@@ -3,9 +3,10 @@ from __future__ import annotations
 import json
 import tempfile
 import unittest
+from unittest import mock
 from pathlib import Path
 
-from romaji_service.pipeline import PronunciationRomajiPipeline
+from romaji_service.pipeline import PronunciationRomajiPipeline, kana_to_ascii_hepburn
 
 
 class PronunciationRomajiPipelineTests(unittest.TestCase):
@@ -29,6 +30,19 @@ class PronunciationRomajiPipelineTests(unittest.TestCase):
                 result = self.pipeline.romanize_text(source)
                 self.assertEqual(result["text"], expected)
 
+    def test_sokuon_doubles_following_consonant(self):
+        cases = {
+            "ちょっと": "chotto",
+            "マッチ": "matchi",
+            "いっしょ": "issho",
+            "あっっっっか": "akkkkka",
+            "っっっっちゃ": "ttttcha",
+        }
+
+        for source, expected in cases.items():
+            with self.subTest(source=source):
+                self.assertEqual(kana_to_ascii_hepburn(source), expected)
+
     def test_line_breaks_and_emoji_are_preserved(self):
         result = self.pipeline.romanize_text("こんにちは🙂\n東京")
         self.assertEqual(result["text"], "konnichiwa🙂\ntoukyou")
@@ -56,6 +70,41 @@ class PronunciationRomajiPipelineTests(unittest.TestCase):
             self.assertEqual(pipeline.romanize_text("推し")["text"], "oshi")
             self.assertEqual(pipeline.romanize_text("推し活")["text"], "oshikatsu-custom")
 
+    def test_batch_romanizes_repeated_lines_once(self):
+        calls = []
+        original = self.pipeline._romanize_text
+
+        def counting_romanize(text, *args, **kwargs):
+            calls.append(text)
+            return original(text, *args, **kwargs)
+
+        with mock.patch.object(self.pipeline, "_romanize_text", side_effect=counting_romanize):
+            result = self.pipeline.romanize_batch(["東京", "学校", "東京"])
+
+        self.assertEqual([item["text"] for item in result["items"]], ["toukyou", "gakkou", "toukyou"])
+        self.assertEqual(calls, ["東京", "学校"])
+
+    def test_batch_runs_contextual_analysis_once_per_document(self):
+        kwja = mock.Mock(spec=["apply_to_document"])
+        kwja.apply_to_document.return_value = object()
+        self.pipeline._kwja = kwja
+
+        result = self.pipeline.romanize_batch(["東京", "hello", "学校"])
+
+        kwja.apply_to_document.assert_called_once_with("東京\nhello\n学校")
+        self.assertEqual(result["contextual_analysis"]["status"], "used")
+        self.assertNotIn("scope", result["contextual_analysis"])
+        stages = [item["stages"]["contextual_analysis"] for item in result["items"]]
+        self.assertEqual(stages[0]["scope"], "document")
+        self.assertEqual(stages[1], {"status": "skipped"})
+        self.assertEqual(stages[2]["scope"], "document")
+        self.assertNotIn("scope", self.pipeline.romanize_text("東京")["stages"]["contextual_analysis"])
+
+    def test_refresh_jumanpp_picks_up_changed_binary(self):
+        with mock.patch.dict("os.environ", {"JUMANPP_BIN": "/opt/jumanpp/bin/jumanpp"}):
+            self.pipeline.refresh_jumanpp()
+        self.assertEqual(self.pipeline.health()["components"]["jumanpp"]["path"], "/opt/jumanpp/bin/jumanpp")
+
     def test_health_reports_python_pipeline_and_optional_components(self):
         health = self.pipeline.health()
         self.assertEqual(health["name"], "python-pronunciation-pipeline")